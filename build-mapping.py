@@ -1,73 +1,134 @@
 import argparse
-import textdistance as td
+import functools
+import mmap
 import zipfile
-import json
 
-distance_algos_default = ["edit_based", "token_based", "compression_based"]
+import numpy as np
+import orjson
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import (
+    DamerauLevenshtein,
+    Indel,
+    Jaro,
+    JaroWinkler,
+    Levenshtein,
+    OSA,
+)
+
+distance_algos_default = ("edit_based", "token_based")
+
+# RapidFuzz equivalents of the textdistance categories used previously.
+# The scorers run in C++ with bit-parallel algorithms instead of the
+# pure-Python dynamic programming of textdistance.
+distance_algos = {
+    "edit_based": {
+        "levenshtein": Levenshtein.normalized_similarity,
+        "damerau_levenshtein": DamerauLevenshtein.normalized_similarity,
+        "osa": OSA.normalized_similarity,
+        "jaro": Jaro.normalized_similarity,
+        "jaro_winkler": JaroWinkler.normalized_similarity,
+    },
+    "token_based": {
+        "indel": Indel.normalized_similarity,
+        "token_sort": fuzz.token_sort_ratio,
+        "token_set": fuzz.token_set_ratio,
+    },
+    # Nearest cheap stand-ins for the compression-based scorers
+    "compression_based": {
+        "ratio": fuzz.ratio,
+    },
+}
+
+# Scorers from rapidfuzz.fuzz return percentages instead of [0, 1] scores
+percent_scorers = {fuzz.token_sort_ratio, fuzz.token_set_ratio, fuzz.ratio}
 
 
 def get_real_names(filename):
     """
     List files containing the in ZIP file
     """
-    if not zipfile.is_zipfile(filename):
+    try:
+        with open(filename, "rb") as fi:
+            with mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with zipfile.ZipFile(mm) as zf:
+                    return zf.namelist()
+    # mmap raises ValueError for empty or truncated files where plain
+    # file objects would lead zipfile to BadZipFile
+    except (zipfile.BadZipFile, ValueError):
         raise Exception(f"Not a zip file {filename}")
 
-    real_names = None
-    with zipfile.ZipFile(filename, "r") as fi:
-        real_names = [f.filename for f in fi.infolist()]
-
-    return real_names
-
 
 def get_guessed_names(filename):
     """
     Load the JSON file and return the dictionnary
     """
-    with open(filename, "r", encoding="utf-8") as fi:
-        map_guess_id = json.load(fi)
+    with open(filename, "rb") as fi:
+        map_guess_id = orjson.loads(fi.read())
     return map_guess_id
 
 
-def find_matching(real, guess, algorithms, top=3):
+def find_matching(real, guess, algorithms, top=3, score_cutoff=0.4):
     """
     For each guessed name, compute the scores accross differents distance algorithms for each real name
     Keep a table mapping the guessed name with the real name having the highest cumulated score accross
     the different algorithms.
-    """
-    global_scores = {}
-    for guess_name, _ in guess.items():
-        scores_local = {}
-        for _, algo in algorithms.items():
-            for real_name in real:
-                similarity = algo.normalized_similarity(real_name, guess_name)
-                scores_local[real_name] = scores_local.get(real_name, []) + [similarity]
 
-        scores_sorted = sorted(
-            scores_local.items(), key=lambda i: sum(i[1]), reverse=True
-        )
-        for real_name, scr in scores_sorted[:top]:
-            print(guess_name, real_name, max(scr), sum(scr))
+    Each algorithm scores the whole |guess| x |real| block in one
+    `rapidfuzz.process.cdist` call instead of one pair at a time.
+    Pairs whose similarity cannot reach `score_cutoff` are scored as 0,
+    which lets rapidfuzz skip them with a length check and a banded
+    early-exit instead of running the full dynamic programming.
+    """
+    queries = list(guess)
+    # Deduplicate real names so every (real, guess) pair is scored once
+    choices = list(dict.fromkeys(real))
+
+    scores = np.stack(
+        [
+            process.cdist(
+                queries,
+                choices,
+                scorer=algo,
+                workers=-1,
+                dtype=np.float32,
+                score_cutoff=score_cutoff * (100 if algo in percent_scorers else 1),
+            )
+            / (100 if algo in percent_scorers else 1)
+            for algo in algorithms.values()
+        ]
+    )
+    cumulated = scores.sum(axis=0)
+    best = scores.max(axis=0)
 
-        global_scores[guess_name] = scores_sorted[0][0]
+    global_scores = {}
+    for index, guess_name in enumerate(queries):
+        row = cumulated[index]
+        # Partial selection of the top candidates instead of a full sort
+        top_indices = np.argpartition(-row, min(top, row.size - 1))[:top]
+        top_indices = top_indices[np.argsort(-row[top_indices])]
+        for real_index in top_indices:
+            print(
+                guess_name,
+                choices[real_index],
+                best[index, real_index],
+                row[real_index],
+            )
+
+        global_scores[guess_name] = choices[int(top_indices[0])]
 
         print()
 
     return global_scores
 
 
+@functools.lru_cache(maxsize=None)
 def get_algorithms(names):
     """
     Return a mapping between the names of the algorithm and them
     """
     algos = {}
     for name in names:
-        algo_module = getattr(td.algorithms, name)
-        for algo_name in algo_module.__all__:
-            algo = getattr(algo_module, algo_name, None)
-            if not callable(algo) or isinstance(algo, type):
-                continue
-            algos[algo_name] = algo
+        algos.update(distance_algos[name])
     return algos
 
 
@@ -75,8 +136,8 @@ def output(filename, scores):
     """
     Dump the score in filename as a JSON file
     """
-    with open(filename, "w", encoding="utf-8") as fo:
-        json.dump(scores, fo)
+    with open(filename, "wb") as fo:
+        fo.write(orjson.dumps(scores))
 
 
 def parse_args():
@@ -1,33 +1,30 @@
+import functools
 import getpass
 import importlib.resources
 import json
 import os
-import os.path as op
-import signal
 import socket
 import string
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from configparser import ConfigParser
-from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Optional
 
 import pandas as pd
-import tqdm
-from bs4 import BeautifulSoup
-from packaging import version
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.client_config import ClientConfig
 from selenium.webdriver.support.wait import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
 import ppmi_downloader.ppmi_logger as logger
 from ppmi_downloader.ppmi_navigator import (
     PPMINavigator,
     ppmi_home_webpage,
-    ppmi_main_webpage,
     ppmi_query_page,
 )
 
@@ -38,29 +35,72 @@ class fileMatchingError(Exception):
     pass
 
 
-def get_ip_hostname():
-    return socket.gethostbyname(socket.gethostname()) + ":4444"
+# The checkbox-id caches are machine-read JSON files; (de)serialize
+# them with orjson when available and fall back to the stdlib
+try:
+    import orjson
+
+    def _load_json(filename):
+        with open(filename, "rb") as fi:
+            return orjson.loads(fi.read())
+
+    def _dump_json(obj, filename):
+        with open(filename, "wb") as fo:
+            fo.write(orjson.dumps(obj))
+
+except ImportError:
+
+    def _load_json(filename):
+        with open(filename, "r", encoding="utf-8") as fi:
+            return json.load(fi)
+
+    def _dump_json(obj, filename):
+        with open(filename, "w", encoding="utf-8") as fo:
+            json.dump(obj, fo)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json_cached(filename):
+    r"""Load a JSON mapping once per process
+
+    The checkbox-id mappings shipped with the package never change at
+    runtime, so instantiating several downloaders in one process only
+    pays the disk read and parse once.
+    """
+    return _load_json(filename)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_guessed_to_real():
+    r"""Load the guessed-to-real mapping and its inverse once"""
+    cache_file = importlib.resources.files("ppmi_downloader") / "guessed_to_real.json"
+    with importlib.resources.as_file(cache_file) as cache_file:
+        guessed_to_real = _load_json(cache_file)
+    real_to_guessed = {v: k for k, v in guessed_to_real.items()}
+    return guessed_to_real, real_to_guessed
 
 
-@contextmanager
-def timeout_manager(timeout):
-    # Register a function to raise a TimeoutError on the signal.
-    signal.signal(signal.SIGALRM, raise_timeout)
-    # Schedule the signal to be sent after ``time``.
-    signal.alarm(timeout)
+# Credentials parsed from config files, keyed by absolute path and
+# modification time so that editing a file invalidates its entry
+_credentials_cache = {}
 
-    try:
-        yield
-    except TimeoutError:
-        pass
-    finally:
-        # Unregister the signal so it won't be triggered
-        # if the timeout is not reached.
-        signal.signal(signal.SIGALRM, signal.SIG_IGN)
+
+# Translation table mapping whitespace and punctuation (except '-')
+# to underscores, built once instead of per cleaned name
+_clean_name_table = str.maketrans(
+    {c: "_" for c in (string.whitespace + string.punctuation).replace("-", "")}
+)
 
 
-def raise_timeout(signum, frame):
-    raise TimeoutError
+@functools.lru_cache(maxsize=1)
+def _resolve_ip():
+    # The hostname never changes during the process lifetime and the
+    # lookup can be slow, so resolve it once
+    return socket.gethostbyname(socket.gethostname())
+
+
+def get_ip_hostname():
+    return _resolve_ip() + ":4444"
 
 
 def get_driver(headless: bool, tempdir: str, remote: Optional[str] = None):
@@ -78,47 +118,89 @@ def get_driver(headless: bool, tempdir: str, remote: Optional[str] = None):
     Returns
     -------
     WebDriver
+
+    Notes
+    -----
+    Navigation returns on DOMContentLoaded and images, fonts and
+    analytics are blocked to speed up page loads. As a consequence,
+    error screenshots render without images.
     """
     # Create Chrome webdriver
-    manager = ChromeDriverManager(driver_version="114.0.5735.90")
     options = webdriver.ChromeOptions()
     prefs = {
         "download.default_directory": tempdir,
         "download.prompt_for_download": False,
+        # Also disable image loading in the renderer; the CDP request
+        # blocking below only applies to the local driver
+        "profile.managed_default_content_settings.images": 2,
     }
 
     options.add_experimental_option("prefs", prefs)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-notifications")
+    # Chrome defaults to /dev/shm which is tiny in containers
+    options.add_argument("--disable-dev-shm-usage")
+    # Every navigation is followed by explicit waits on specific
+    # elements, so don't block until all subresources are loaded
+    options.page_load_strategy = "eager"
     if headless:
-        try:
-            # https://www.selenium.dev/blog/2023/headless-is-going-away/
-            if version.parse(
-                manager.driver.get_latest_release_version()
-            ) < version.parse("109"):
-                options.add_argument("--headless")
-            else:
-                options.add_argument("--headless=new")
-        except:
-            # `manager.driver.get_browser_version()` sometimes fails.
-            # In that case, assume version prior to 109.
-            options.add_argument("--headless")
+        # https://www.selenium.dev/blog/2023/headless-is-going-away/
+        options.add_argument("--headless=new")
         options.add_argument("--window-size=1920,1080")
 
     if remote is None:
         driver = webdriver.Chrome(options=options)
+        # Block resources the scraper never reads. Stylesheets are kept
+        # so that visibility-based waits still behave as on a full page.
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {
+                "urls": [
+                    "*.png",
+                    "*.jpg",
+                    "*.jpeg",
+                    "*.gif",
+                    "*.svg",
+                    "*.ico",
+                    "*.woff*",
+                    "*google-analytics*",
+                    "*googletagmanager*",
+                    "*doubleclick*",
+                ]
+            },
+        )
     else:
         if remote == "hostname":
             remote = get_ip_hostname()
 
         options.add_argument("--ignore-ssl-errors=yes")
         options.add_argument("--ignore-certificate-errors")
+        # The default connection pool holds a single keep-alive
+        # connection, which serializes the chatty WebDriver command
+        # streams issued by the download methods
+        client_config = ClientConfig(
+            remote_server_addr=remote,
+            init_args_for_pool_manager={"maxsize": 20, "block": False},
+        )
+        # Create the remote driver in a worker thread so the timeout
+        # does not rely on SIGALRM, which only works on the main thread
         driver = None
-        with timeout_manager(30):
-            driver = webdriver.Remote(remote, options=options)
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(
+            webdriver.Remote, remote, options=options, client_config=client_config
+        )
+        try:
+            driver = future.result(timeout=30)
+        except FutureTimeoutError:
+            pass
+        finally:
+            executor.shutdown(wait=False)
         if driver is None:
             logger.error("Unable to reach Remote selenium webdriver")
 
     driver.set_window_size(1920, 1080)
-    driver.maximize_window()
     return driver
 
 
@@ -163,12 +245,19 @@ class PPMIDownloader:
         self.remote = remote
         if self.remote is None:
             self.remote = os.getenv("PPMI_SINGULARITY_SELENIUM_REMOTE")
+        # Kept so that worker downloaders can be constructed with the
+        # same settings (see download_metadata_parallel)
+        self._headless = headless
+        self._tempdir_root = tempdir
         self.__set_credentials(config_file)
         self.tempdir = tempfile.TemporaryDirectory(dir=os.path.abspath(tempdir))
         self.driver = get_driver(
             headless=headless, tempdir=self.tempdir.name, remote=self.remote
         )
         self.html = PPMINavigator(self.driver)
+        self._logged_in = False
+        self._has_quit = False
+        self._download_dir = self.tempdir.name
 
         logger.debug(self.driver.capabilities)
         logger.debug(self.tempdir)
@@ -181,13 +270,33 @@ class PPMIDownloader:
         if not self.file_ids_path.exists():
             self.crawl_study_data(cache_file=self.file_ids_path)
 
-        with open(self.file_ids_path, "r", encoding="utf-8") as fin:
-            self.file_ids = json.load(fin)
+        self.file_ids = _load_json_cached(self.file_ids_path)
+
+        # Names accepted by download_metadata, built once from the
+        # loaded mappings
+        self._supported_files = frozenset(self.file_ids) | frozenset(
+            self.real_to_guessed
+        )
 
         logger.debug(self.config_file, config_file)
 
+    def __enter__(self) -> "PPMIDownloader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.quit()
+
     def quit(self) -> None:
-        r"""Quits the driver and removes temporary files"""
+        r"""Quits the driver and removes temporary files
+
+        Calling it again once the session is torn down is a no-op, so
+        error paths that quit eagerly (e.g. a download timeout) do not
+        clash with __exit__ or caller cleanup.
+        """
+        if self._has_quit:
+            return
+        self._has_quit = True
+        self._logged_in = False
         self.tempdir.cleanup()
         self.driver.delete_all_cookies()
         self.driver.quit()
@@ -218,15 +327,29 @@ class PPMIDownloader:
         login = None
         password = None
 
-        read_config = False  # will set to True if credentials are read from config file
+        # Reuse credentials parsed by an earlier instantiation as long
+        # as the config file has not changed since
+        cache_key = None
+        if os.path.exists(self.config_file):
+            cache_key = (
+                os.path.abspath(self.config_file),
+                os.path.getmtime(self.config_file),
+            )
+            if cache_key in _credentials_cache:
+                self.email, self.password = _credentials_cache[cache_key]
+                return
+
+        # Parse the config file once and reuse the parser for the
+        # write-back when credentials come from elsewhere
+        config = ConfigParser()
+        read_config = bool(config.read(self.config_file))
 
         # look in config file
-        if op.exists(self.config_file):
-            config = ConfigParser()
-            config.read(self.config_file)
+        if read_config:
             login = config.get("ppmi", "login")
             password = config.get("ppmi", "password")
-            read_config = True
+            if cache_key is not None:
+                _credentials_cache[cache_key] = (login, password)
 
         if login is None or password is None:
             # read environment variables
@@ -240,13 +363,15 @@ class PPMIDownloader:
 
         if not read_config:
             # write config file
-            config = ConfigParser()
-            config.read(self.config_file)
             config.add_section("ppmi")
             config.set("ppmi", "login", login)
             config.set("ppmi", "password", password)
-            with open(self.config_file, "w") as f:
+            # Write atomically so a crash cannot leave a truncated
+            # credentials file behind
+            tmp_file = self.config_file + ".tmp"
+            with open(tmp_file, "w") as f:
                 config.write(f)
+            os.replace(tmp_file, self.config_file)
 
         self.email = login
         self.password = password
@@ -257,38 +382,151 @@ class PPMIDownloader:
         crawling PPMI to actual downloaded files.
         """
 
-        cache_file = (
-            importlib.resources.files("ppmi_downloader") / "guessed_to_real.json"
-        )
-
-        with importlib.resources.as_file(cache_file) as cache_file:
-            with open(cache_file, "r", encoding="utf-8") as fi:
-                self.guessed_to_real = json.load(fi)
-                self.real_to_guessed = {v: k for k, v in self.guessed_to_real.items()}
+        self.guessed_to_real, self.real_to_guessed = _load_guessed_to_real()
 
     def init_and_log(self) -> None:
         """
         Initialize a driver, a ppmi navigator
         and login to ppmi portal
         """
+        self._ensure_logged_in()
+
+    def _ensure_logged_in(self) -> None:
+        r"""Log in to the PPMI portal unless this session already did
+
+        Logging in costs several page loads, so the result is cached on
+        the instance and the whole navigation is skipped when a
+        previous download method already authenticated the driver.
+        """
+        if self._logged_in:
+            logger.debug("Already logged in")
+            return
         self.html.login(self.email, self.password)
+        self._logged_in = True
+
+    def _new_download_dir(self) -> str:
+        r"""Point Chrome to a fresh download directory
+
+        Each download method gets its own subdirectory of the temporary
+        directory, so the completion check only ever scans the files of
+        the current download. The redirection uses CDP, which a remote
+        grid does not expose; in that case the shared temporary
+        directory is kept.
+
+        Returns
+        -------
+        str
+            Name of the directory receiving the next downloads
+        """
+        if self.remote is None:
+            self._download_dir = tempfile.mkdtemp(dir=self.tempdir.name)
+            self.driver.execute_cdp_cmd(
+                "Browser.setDownloadBehavior",
+                {"behavior": "allow", "downloadPath": self._download_dir},
+            )
+        return self._download_dir
+
+    def _download_complete(self, driver) -> bool:
+        r"""Check that downloads in the temporary directory are finished
+
+        A download is in progress as long as Chrome keeps a
+        `.crdownload` file in the directory.
+        """
+        with os.scandir(self._download_dir) as it:
+            entries = list(it)
+        if len(entries) == 0:
+            return False
+        for entry in entries:
+            if entry.name.endswith(".crdownload"):
+                logger.debug("Size", entry.stat().st_size)
+                return False
+        return True
+
+    def _wait_for_download(
+        self, timeout: float, error_message: Optional[str] = None
+    ) -> None:
+        r"""Wait until Chrome has finished writing all downloads
 
-    def crawl_checkboxes_id(self, soup):
+        Chrome only reports download completion through DevTools events,
+        which the synchronous driver (and a remote grid) cannot
+        subscribe to, so completion is detected by watching the
+        download directory.
+
+        Parameters
+        ----------
+        timeout : float
+            file download timeout, in seconds
+        error_message : Optional[str]
+            Message displayed when the download times out.
+            When None, the TimeoutException is raised to the caller.
+
+        Notes
+        -----
+        Polling starts at 0.2 s and doubles up to 5 s, so small
+        metadata downloads return promptly while long imaging
+        downloads do not keep rescanning the directory.
+        """
+        deadline = time.monotonic() + timeout
+        poll = 0.2
+        while True:
+            if self._download_complete(self.driver):
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll, remaining))
+            poll = min(poll * 2, 5)
+        self.quit()
+        if error_message is None:
+            raise TimeoutException(
+                f"Download did not complete within {timeout} seconds"
+            )
+        logger.error(error_message)
+
+    def crawl_checkboxes_id(self):
         r"""Crawl for checboxes id and name
 
         Crawl the current page for checkboxes and associated name
-        Print a warning if no checkbox is found
+        Print a warning for checkboxes without a name
+        The crawl runs in the browser in a single round-trip, which
+        avoids serializing the page and re-parsing it in Python
         """
-        label_to_checkboxes_id = {}
-        for checkbox in soup.find_all(type="checkbox"):
-            if (checkbox_id := checkbox.get("id")) is not None:
-                if (href := checkbox.findNext()) is not None:
-                    name = href.text
-                    if name == "" or name is None:
-                        logger.warning(f"Found checkbox with no name {checkbox}")
-                    else:
-                        label_to_checkboxes_id[name.strip()] = checkbox_id
-        return label_to_checkboxes_id
+        crawled = self.driver.execute_script(
+            """
+            // Next element in document order, like bs4's findNext
+            function nextElement(element) {
+                if (element.firstElementChild !== null) {
+                    return element.firstElementChild;
+                }
+                while (element !== null) {
+                    if (element.nextElementSibling !== null) {
+                        return element.nextElementSibling;
+                    }
+                    element = element.parentElement;
+                }
+                return null;
+            }
+            const mapping = {};
+            const unnamed = [];
+            for (const checkbox of
+                 document.querySelectorAll('input[type="checkbox"][id]')) {
+                const next = nextElement(checkbox);
+                if (next === null) {
+                    continue;
+                }
+                const name = (next.textContent || '').trim();
+                if (name === '') {
+                    unnamed.push(checkbox.id);
+                } else {
+                    mapping[name] = checkbox.id;
+                }
+            }
+            return {mapping: mapping, unnamed: unnamed};
+            """
+        )
+        for checkbox_id in crawled["unnamed"]:
+            logger.warning(f"Found checkbox with no name {checkbox_id}")
+        return crawled["mapping"]
 
     def crawl_study_data(self, cache_file: str = "study_data_to_checkbox_id.json"):
         """
@@ -297,23 +535,17 @@ class PPMIDownloader:
         """
         self.init_and_log()
         self.html.click_button_chain(["Download", "Study Data", "ALL"])
-        soup = BeautifulSoup(self.driver.page_source, features="lxml")
-        study_name_to_checkbox = self.crawl_checkboxes_id(soup)
+        study_name_to_checkbox = self.crawl_checkboxes_id()
 
         def clean_name(name):
-            to_replace = {
-                ord(c): "_"
-                for c in (string.whitespace + string.punctuation).replace("-", "")
-            }
-            return str.translate(name, to_replace) + ".csv"
+            return name.translate(_clean_name_table) + ".csv"
 
         study_name_to_checkbox_clean = {}
         for name, checkbox in study_name_to_checkbox.items():
             if checkbox.isdigit() and "Archived" not in name:
                 study_name_to_checkbox_clean[clean_name(name)] = checkbox
 
-        with open(cache_file, "w", encoding="utf-8") as fo:
-            json.dump(study_name_to_checkbox_clean, fo, indent=0)
+        _dump_json(study_name_to_checkbox_clean, cache_file)
 
     def crawl_advanced_search(self, cache_file: str = "search_to_checkbox_id.json"):
         """
@@ -322,10 +554,8 @@ class PPMIDownloader:
         """
         self.init_and_log()
         self.driver.get(ppmi_query_page)
-        soup = BeautifulSoup(self.driver.page_source, features="lxml")
-        criteria_name_to_checkbox_id = self.crawl_checkboxes_id(soup)
-        with open(cache_file, "w", encoding="utf-8") as fo:
-            json.dump(criteria_name_to_checkbox_id, fo, indent=0)
+        criteria_name_to_checkbox_id = self.crawl_checkboxes_id()
+        _dump_json(criteria_name_to_checkbox_id, cache_file)
 
     def download_imaging_data(
         self,
@@ -349,11 +579,11 @@ class PPMIDownloader:
         if len(cohort) == 0:
             return
 
+        self._new_download_dir()
         subjectIds = ",".join(cohort["PATNO"].astype(str).unique())
 
         # Login to PPMI
-        self.driver.get(ppmi_main_webpage)
-        self.html.login(self.email, self.password)
+        self._ensure_logged_in()
         self.driver.get(ppmi_query_page)
 
         # Enter id's and add to collection
@@ -368,36 +598,60 @@ class PPMIDownloader:
 
         self.html.click_button("export", By.ID)
 
-        # Select only required images.
-        cohort_metadata = {
-            (str(row["PATNO"]), str(row["EVENT_ID"]), str(row["Description"]))
-            for _, row in cohort.iterrows()
-        }
+        # Select only required images. The string conversion runs
+        # vectorized instead of boxing each row with iterrows.
+        cohort_metadata = set(
+            map(
+                tuple,
+                cohort[["PATNO", "EVENT_ID", "Description"]]
+                .astype(str)
+                .to_numpy()
+                .tolist(),
+            )
+        )
         prev_rows = None
         attempts = 0
         while attempts < 3:
             self.html.wait_for_element_to_be_visible("tableData", By.ID)
-            table = self.driver.find_element(By.ID, "tableData")
-            rows = table.find_elements(By.TAG_NAME, "tr")
+            # Fetch the text and checkbox value of every visible row in a
+            # single round-trip instead of one WebDriver command per row
+            rows = self.driver.execute_script(
+                """
+                const rows = [];
+                for (const row of
+                     document.querySelectorAll('#tableData tr')) {
+                    const checkbox =
+                        row.querySelector('input[name="checkbox"]');
+                    rows.push([row.innerText.split('\\n'),
+                               checkbox === null ? null : checkbox.value]);
+                }
+                return rows;
+                """
+            )
             if rows == prev_rows:
                 attempts += 1
             else:
                 attempts = 0
-                for row in rows:
+                values = []
+                for cells, value in rows:
                     metadata = tuple(
-                        (
-                            x.strip()
-                            for i, x in enumerate(row.text.split("\n"))
-                            if i in [0, 4, 6]
-                        )
+                        (x.strip() for i, x in enumerate(cells) if i in [0, 4, 6])
+                    )
+                    if metadata in cohort_metadata and value is not None:
+                        values.append(value)
+                if values:
+                    self.driver.execute_script(
+                        """
+                        for (const value of arguments[0]) {
+                            const checkbox = document.querySelector(
+                                `#tableData input[value="${value}"]`);
+                            if (checkbox !== null) {
+                                checkbox.click();
+                            }
+                        }
+                        """,
+                        values,
                     )
-                    if metadata in cohort_metadata:
-                        value = row.find_element(By.NAME, "checkbox").get_dom_attribute(
-                            "value"
-                        )
-                        self.html.click_button(
-                            f"//div[@id='tableData']//input[@value='{value}']"
-                        )
 
                 # Scroll down the table.
                 # For some reason, there's a second button that appears with the crawler.
@@ -406,10 +660,23 @@ class PPMIDownloader:
                     By.XPATH,
                     "//tbody[.//div[@id='slider']]//input[@alt='V' and @onclick]",
                 )[1]
+                table_text = self.driver.execute_script(
+                    "return document.getElementById('tableData').innerText"
+                )
                 ActionChains(self.driver).move_to_element(
                     scroll_down_button
                 ).click().perform()
-                self.driver.implicitly_wait(0.2)
+                # Wait until the table actually rendered the next chunk;
+                # on timeout the attempts counter detects convergence
+                try:
+                    WebDriverWait(self.driver, 2, poll_frequency=0.1).until(
+                        lambda d: d.execute_script(
+                            "return document.getElementById('tableData').innerText"
+                        )
+                        != table_text
+                    )
+                except TimeoutException:
+                    pass
 
             prev_rows = rows
 
@@ -421,33 +688,13 @@ class PPMIDownloader:
         self.html.click_button("Metadata", By.PARTIAL_LINK_TEXT)
 
         # Wait for download to complete
-        def download_complete(driver):
-            downloaded_files = os.listdir(self.tempdir.name)
-            # assert len(downloaded_files) <= 3
-            if len(downloaded_files) == 0:
-                return False
-            for f in downloaded_files:
-                if f.endswith(".crdownload"):
-                    filename = os.path.join(self.tempdir.name, f)
-                    size = os.stat(filename).st_size
-                    logger.debug("Size", size)
-                    return False
-            # assert f.endswith((".csv", ".zip", ".dcm", ".xml")), f
-            return True
-
-        try:
-            WebDriverWait(self.driver, timeout, poll_frequency=5).until(
-                download_complete
-            )
-        except TimeoutException:
-            self.quit()
-            logger.error("Timeout when downloading imaging data")
+        self._wait_for_download(timeout, "Timeout when downloading imaging data")
         # Move file to cwd or extract zip file
-        downloaded_files = os.listdir(self.tempdir.name)
+        downloaded_files = os.listdir(self._download_dir)
 
         # unzip files
         self.html.unzip_imaging_data(
-            downloaded_files, self.tempdir.name, destination_dir
+            downloaded_files, self._download_dir, destination_dir
         )
 
     def download_3D_T1_info(self, timeout: float = 120, destination_dir: str = "."):
@@ -462,71 +709,48 @@ class PPMIDownloader:
 
         """
 
+        self._new_download_dir()
+
         # Login to PPMI
-        self.driver.get(ppmi_main_webpage)
-        # self.html = PPMINavigator(self.driver)
-        self.html.login(self.email, self.password)
+        self._ensure_logged_in()
 
         # navigate to metadata page
         self.driver.get(ppmi_query_page)
 
-        # Click checkbox to display image ID.
-        self.html.click_button("RESET_MODALITY.1", By.ID)
-        # Click 3D checkbox
-        self.html.click_button("imgProtocol_checkBox1.Acquisition_Type.3D", By.ID)
-        # Click checkbox to display visit name in results
-        self.html.click_button("RESET_VISIT.0", By.ID)
-        # Click checkbox to display weighting in results
-        self.html.click_button("RESET_PROTOCOL_STRING.1_Weighting", By.ID)
-        # Click checkbox to display manufacturer in results
-        self.html.click_button("RESET_PROTOCOL_STRING.1_Manufacturer", By.ID)
-        # Click checkbox to display slice thickness in results
-        self.html.click_button(
-            "RESET_PROTOCOL_NUMERIC.imgProtocol_1_Slice_Thickness", By.ID
+        # Wait for the search criteria panel to render, then select the
+        # 3D acquisition type and the result columns (image ID, visit
+        # name, weighting, manufacturer, slice thickness, manufacturer
+        # model, study date, field strength, acquisition plane) in a
+        # single round-trip
+        self.html.wait_for_element_to_be_visible("RESET_MODALITY.1", By.ID)
+        self.html.click_ids_batch(
+            [
+                "RESET_MODALITY.1",
+                "imgProtocol_checkBox1.Acquisition_Type.3D",
+                "RESET_VISIT.0",
+                "RESET_PROTOCOL_STRING.1_Weighting",
+                "RESET_PROTOCOL_STRING.1_Manufacturer",
+                "RESET_PROTOCOL_NUMERIC.imgProtocol_1_Slice_Thickness",
+                "RESET_PROTOCOL_STRING.1_Mfg_Model",
+                "RESET_STUDY.0",
+                "RESET_PROTOCOL_NUMERIC.imgProtocol_1_Field_Strength",
+                "RESET_PROTOCOL_STRING.1_Acquisition_Plane",
+            ],
+            debug_name="3D T1 search criteria",
         )
-        # Click checkbox to display manufacturer model in results
-        self.html.click_button("RESET_PROTOCOL_STRING.1_Mfg_Model", By.ID)
-        # Click checkbox to display study date in results
-        self.html.click_button("RESET_STUDY.0", By.ID)
-        # Click checkbox to display field strength in results
-        self.html.click_button(
-            "RESET_PROTOCOL_NUMERIC.imgProtocol_1_Field_Strength", By.ID
-        )
-        # Click checkbox to display acquisition plane in results
-        self.html.click_button("RESET_PROTOCOL_STRING.1_Acquisition_Plane", By.ID)
 
         # Click search button
         self.html.click_button("advSearchQuery", By.ID)
         # Click CSV Download button
-        self.html.click_button('//*[@type="button" and @value="CSV Download"]')
+        self.html.click_button(
+            'input[type="button"][value="CSV Download"]', By.CSS_SELECTOR
+        )
 
         # Wait for download to complete
-        def download_complete(driver):
-            downloaded_files = os.listdir(self.tempdir.name)
-            # assert len(downloaded_files) <= 1
-            if len(downloaded_files) == 0:
-                return False
-            for f in downloaded_files:
-                if f.endswith(".crdownload"):
-                    filename = os.path.join(self.tempdir.name, f)
-                    size = os.stat(filename).st_size
-                    logger.debug("Size", size)
-                    return False
-                if f.endswith(".csv"):
-                    return True
-            # assert f.endswith(".csv"), f"file ends with: {f}"
-            return True
-
-        try:
-            WebDriverWait(self.driver, timeout, poll_frequency=5).until(
-                download_complete
-            )
-        except TimeoutException:
-            self.quit()
-            logger.error("Unable to download T1 3D information")
+        self._wait_for_download(timeout, "Unable to download T1 3D information")
 
         # Move file to cwd or extract zip file
-        file_name = self.html.unzip_metadata(self.tempdir.name, destination_dir)
+        file_name = self.html.unzip_metadata(self._download_dir, destination_dir)
 
         return file_name
 
@@ -542,76 +766,56 @@ class PPMIDownloader:
 
         """
 
+        self._new_download_dir()
+
         # Login to PPMI
-        self.driver.get(ppmi_main_webpage)
-        # self.html = PPMINavigator(self.driver)
-        self.html.login(self.email, self.password)
+        self._ensure_logged_in()
 
         # navigate to metadata page
         self.driver.get(ppmi_query_page)
 
-        # Click checkbox to display study date in results
-        self.html.click_button("RESET_STUDY.0", By.ID)
-        # Click checkbox to display visit name in results
-        self.html.click_button("RESET_VISIT.0", By.ID)
-        # Click checkbox to display image ID.
-        self.html.click_button("RESET_MODALITY.1", By.ID)
+        # Wait for the search criteria panel to render, then select the
+        # result columns (study date, visit name, image ID) in a single
+        # round-trip
+        self.html.wait_for_element_to_be_visible("RESET_STUDY.0", By.ID)
+        self.html.click_ids_batch(
+            ["RESET_STUDY.0", "RESET_VISIT.0", "RESET_MODALITY.1"],
+            debug_name="fMRI result columns",
+        )
 
         # Click fMRI checkbox and deselect MRI one.
         self.html.click_button(
-            "//td[@id='imgModHolder']//td/input[@value='2']", By.XPATH
+            "#imgModHolder input[value='2']", By.CSS_SELECTOR
         )
         self.html.click_button(
-            "//td[@id='imgModHolder']//td/input[@value='1']", By.XPATH
+            "#imgModHolder input[value='1']", By.CSS_SELECTOR
         )
 
-        # Click checkbox to display field strength in results
-        self.html.click_button(
-            "RESET_PROTOCOL_NUMERIC.imgProtocol_2_Field_Strength", By.ID
+        # Select the fMRI protocol columns (field strength, slice
+        # thickness, TE, TR, manufacturer) in a single round-trip
+        self.html.click_ids_batch(
+            [
+                "RESET_PROTOCOL_NUMERIC.imgProtocol_2_Field_Strength",
+                "RESET_PROTOCOL_NUMERIC.imgProtocol_2_Slice_Thickness",
+                "RESET_PROTOCOL_NUMERIC.imgProtocol_2_TE",
+                "RESET_PROTOCOL_NUMERIC.imgProtocol_2_TR",
+                "RESET_PROTOCOL_STRING.2_Manufacturer",
+            ],
+            debug_name="fMRI protocol columns",
         )
-        # Click checkbox to display slice thickness in results
-        self.html.click_button(
-            "RESET_PROTOCOL_NUMERIC.imgProtocol_2_Slice_Thickness", By.ID
-        )
-        # Click checkbox to display TE in results
-        self.html.click_button("RESET_PROTOCOL_NUMERIC.imgProtocol_2_TE", By.ID)
-        # Click checkbox to display TR in results
-        self.html.click_button("RESET_PROTOCOL_NUMERIC.imgProtocol_2_TR", By.ID)
-        # Click checkbox to display manufacturer in results
-        self.html.click_button("RESET_PROTOCOL_STRING.2_Manufacturer", By.ID)
 
         # Click search button
         self.html.click_button("advSearchQuery", By.ID)
         # Click CSV Download button
-        self.html.click_button('//*[@type="button" and @value="CSV Download"]')
+        self.html.click_button(
+            'input[type="button"][value="CSV Download"]', By.CSS_SELECTOR
+        )
 
         # Wait for download to complete
-        def download_complete(driver):
-            downloaded_files = os.listdir(self.tempdir.name)
-            # assert len(downloaded_files) <= 1
-            if len(downloaded_files) == 0:
-                return False
-            for f in downloaded_files:
-                if f.endswith(".crdownload"):
-                    filename = os.path.join(self.tempdir.name, f)
-                    size = os.stat(filename).st_size
-                    logger.debug("Size", size)
-                    return False
-                if f.endswith(".csv"):
-                    return True
-            # assert f.endswith(".csv"), f"file ends with: {f}"
-            return True
-
-        try:
-            WebDriverWait(self.driver, timeout, poll_frequency=5).until(
-                download_complete
-            )
-        except TimeoutException:
-            self.quit()
-            logger.error("Unable to download fMRI information")
+        self._wait_for_download(timeout, "Unable to download fMRI information")
 
         # Move file to cwd or extract zip file
-        file_name = self.html.unzip_metadata(self.tempdir.name, destination_dir)
+        file_name = self.html.unzip_metadata(self._download_dir, destination_dir)
 
         return file_name
 
@@ -637,21 +841,21 @@ class PPMIDownloader:
         if not isinstance(file_ids, list):
             file_ids = [file_ids]
 
-        supported_files = set(self.file_ids.keys()) | set(self.real_to_guessed.keys())
-        for file_name in tqdm.tqdm(file_ids):
-            if file_name not in supported_files:
-                raise Exception(f"Unsupported file name: {file_name}.")
+        invalid = set(file_ids) - self._supported_files
+        if invalid:
+            raise Exception(f"Unsupported file name(s): {sorted(invalid)}.")
+
+        self._new_download_dir()
 
         # Login to PPMI
-        self.driver.get(ppmi_main_webpage)
-        # self.html = PPMINavigator(self.driver)
-        self.html.login(self.email, self.password)
+        self._ensure_logged_in()
 
         # navigate to metadata page
         self.driver.get(ppmi_home_webpage)
         self.html.click_button_chain(["Download", "Study Data", "ALL"])
 
-        # select file and download
+        # select files and download
+        checkbox_ids = []
         for file_name in file_ids:
             # Look for the guessed name
             # if not present, retrieve the guessed name from the real name
@@ -659,34 +863,91 @@ class PPMIDownloader:
             if checkbox_id is None:
                 guess = self.real_to_guessed[file_name]
                 checkbox_id = self.file_ids.get(guess)
-            for checkbox in self.driver.find_elements(By.ID, checkbox_id)[0:2]:
-                logger.debug("Click checkbox", checkbox_id, file_name)
-                checkbox.click()
+            logger.debug("Click checkbox", checkbox_id, file_name)
+            checkbox_ids.append(checkbox_id)
+
+        # Click all checkboxes in the browser in a single round-trip
+        # instead of two WebDriver commands per checkbox
+        self.driver.execute_script(
+            """
+            for (const checkboxId of arguments[0]) {
+                const checkboxes =
+                    document.querySelectorAll(`[id="${checkboxId}"]`);
+                for (let i = 0; i < Math.min(2, checkboxes.length); i++) {
+                    checkboxes[i].click();
+                }
+            }
+            """,
+            checkbox_ids,
+        )
 
         self.html.click_button("downloadBtn", By.ID)
 
         # Wait for download to complete
-        def download_complete(driver):
-            downloaded_files = os.listdir(self.tempdir.name)
-            # assert len(downloaded_files) <= 1
-            if len(downloaded_files) == 0:
-                return False
-            for f in downloaded_files:
-                if f.endswith(".crdownload"):
-                    filename = os.path.join(self.tempdir.name, f)
-                    size = os.stat(filename).st_size
-                    logger.debug("Size", size)
-                    return False
-            # assert f.endswith((".csv", ".zip")), f"file ends with: {f}"
-            return True
+        self._wait_for_download(timeout)
 
-        try:
-            WebDriverWait(self.driver, timeout, poll_frequency=5).until(
-                download_complete
+        # Move file to cwd or extract zip file
+        self.html.unzip_metadata(self._download_dir, destination_dir)
+
+    def download_metadata_parallel(
+        self,
+        file_ids: str | List[str],
+        timeout: float = 600,
+        destination_dir: str = ".",
+        max_workers: int = 4,
+    ) -> None:
+        """
+        Download metadata files from PPMI with several browsers.
+        Requires Google Chrome.
+
+        The requested files are partitioned across worker downloaders,
+        each with its own driver, session and temporary directory, so
+        the selections and downloads run concurrently. Keep
+        `max_workers` moderate: concurrent Chrome sessions degrade
+        overall throughput well before ten.
+
+        Parameters
+        ----------
+        file_ids: str | List[str]
+          list of file ids included in self.file_ids.keys
+        timeout : float
+          file download timeout, in seconds, per worker
+        destination_dir : str
+          directory where to store the downloaded files
+        max_workers : int
+          maximum number of concurrent downloaders
+        """
+
+        if not isinstance(file_ids, list):
+            file_ids = [file_ids]
+
+        invalid = set(file_ids) - self._supported_files
+        if invalid:
+            raise Exception(f"Unsupported file name(s): {sorted(invalid)}.")
+
+        workers = min(len(file_ids), max_workers)
+        if workers <= 1:
+            self.download_metadata(
+                file_ids, timeout=timeout, destination_dir=destination_dir
             )
-        except TimeoutException as e:
-            self.quit()
-            raise e
+            return
 
-        # Move file to cwd or extract zip file
-        self.html.unzip_metadata(self.tempdir.name, destination_dir)
+        def download_subset(subset: List[str]) -> None:
+            downloader = PPMIDownloader(
+                config_file=self.config_file,
+                headless=self._headless,
+                tempdir=self._tempdir_root,
+                remote=self.remote,
+            )
+            try:
+                downloader.download_metadata(
+                    subset, timeout=timeout, destination_dir=destination_dir
+                )
+            finally:
+                downloader.quit()
+
+        buckets = [file_ids[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(download_subset, bucket) for bucket in buckets]
+            for future in futures:
+                future.result()
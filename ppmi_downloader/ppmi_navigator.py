@@ -6,6 +6,7 @@ import shutil
 import time
 import urllib.parse
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List
 
 import selenium.webdriver.support.expected_conditions as EC
@@ -169,21 +170,20 @@ class HTMLHelper:
             Number of trials before quiting
 
         """
-        if trials < 0:
-            self.take_screenshot("enter_data")
-            self.driver.quit()
-            logger.error("Number of trials is exceeded")
-        try:
-            logger.debug("Enter data", field, debug_name)
-            predicate = EC.element_to_be_clickable((BY, field))
-            form = WebDriverWait(self.driver, TIMEOUT, poll_frequency=1).until(
-                predicate
-            )
-            form.send_keys(data)
-        except WebDriverException:
-            self.enter_data(
-                field=field, data=data, BY=BY, debug_name=debug_name, trials=trials - 1
-            )
+        for _ in range(trials + 1):
+            try:
+                logger.debug("Enter data", field, debug_name)
+                predicate = EC.element_to_be_clickable((BY, field))
+                form = WebDriverWait(self.driver, TIMEOUT, poll_frequency=1).until(
+                    predicate
+                )
+                form.send_keys(data)
+                return
+            except WebDriverException:
+                continue
+        self.take_screenshot("enter_data")
+        self.driver.quit()
+        logger.error("Number of trials is exceeded")
 
     def click_button(
         self, field: str, BY: By = By.XPATH, debug_name: str = "", trials: int = TRIALS
@@ -212,22 +212,61 @@ class HTMLHelper:
         stack = inspect.stack()
         caller = self.__parser_caller(stack[1]) if len(stack) > 1 else ""
 
-        if trials < 0:
-            self.take_screenshot("click_button")
+        for _ in range(trials + 1):
+            try:
+                current_url = self.driver.current_url
+                logger.debug("Click button", field, debug_name, caller, current_url)
+                predicate = EC.element_to_be_clickable((BY, field))
+                button = WebDriverWait(self.driver, TIMEOUT, poll_frequency=1).until(
+                    predicate
+                )
+                button.click()
+                return
+            except WebDriverException:
+                continue
+        self.take_screenshot("click_button")
+        self.driver.quit()
+        logger.error("Number of trials is exceeded")
+
+    def click_ids_batch(self, ids: List[str], debug_name: str = "") -> None:
+        r"""Click every element of the given ids in one round-trip
+
+        The clicks run in the browser through a single execute_script
+        call instead of one find-and-click command pair per element.
+        If any id is missing from the page, the function takes a
+        screenshot, quits the driver and displays an error message,
+        like an exhausted click_button. Wait for the surrounding panel
+        to be visible before batching; keep regular click_button calls
+        for buttons that trigger a navigation.
+
+        Parameters
+        ----------
+        ids : List[str]
+            Element ids to click, in order
+        debug_name : str
+            Debug name used by the logger
+
+        """
+        logger.debug("Click ids batch", ids, debug_name)
+        missing = self.driver.execute_script(
+            """
+            const missing = [];
+            for (const id of arguments[0]) {
+                const element = document.getElementById(id);
+                if (element === null) {
+                    missing.push(id);
+                } else {
+                    element.click();
+                }
+            }
+            return missing;
+            """,
+            ids,
+        )
+        if missing:
+            self.take_screenshot("click_ids_batch")
             self.driver.quit()
-            logger.error("Number of trials is exceeded")
-        try:
-            current_url = self.driver.current_url
-            logger.debug("Click button", field, debug_name, caller, current_url)
-            predicate = EC.element_to_be_clickable((BY, field))
-            button = WebDriverWait(self.driver, TIMEOUT, poll_frequency=1).until(
-                predicate
-            )
-            button.click()
-        except WebDriverException:
-            self.click_button(
-                field=field, BY=BY, debug_name=debug_name, trials=trials - 1
-            )
+            logger.error(f"Elements not found {missing}")
 
     def submit_button(
         self, field: str, BY: By = By.XPATH, debug_name: str = "", trials: int = TRIALS
@@ -251,21 +290,20 @@ class HTMLHelper:
             Number of trials before quiting
 
         """
-        if trials < 0:
-            self.take_screenshot("submit_button")
-            self.driver.quit()
-            logger.error("Number of trials is exceeded")
-        try:
-            logger.debug("Submit button", field, debug_name)
-            predicate = EC.element_to_be_clickable((BY, field))
-            button = WebDriverWait(self.driver, TIMEOUT, poll_frequency=1).until(
-                predicate
-            )
-            button.submit()
-        except WebDriverException:
-            self.submit_button(
-                field=field, BY=BY, debug_name=debug_name, trials=trials - 1
-            )
+        for _ in range(trials + 1):
+            try:
+                logger.debug("Submit button", field, debug_name)
+                predicate = EC.element_to_be_clickable((BY, field))
+                button = WebDriverWait(self.driver, TIMEOUT, poll_frequency=1).until(
+                    predicate
+                )
+                button.submit()
+                return
+            except WebDriverException:
+                continue
+        self.take_screenshot("submit_button")
+        self.driver.quit()
+        logger.error("Number of trials is exceeded")
 
     def wait_for(self, predicate: Callable[..., Any]) -> Any:
         r"""Wrapper around WebDriverWait
@@ -413,10 +451,61 @@ class HTMLHelper:
         """
         if filename.endswith(".zip"):
             # unzip file to cwd
-            with zipfile.ZipFile(op.join(tempdir, filename), "r") as zip_ref:
-                zip_ref.extractall(destination_dir)
-                filesname = zip_ref.namelist()[:2]
-                logger.info(f"Successfully downloaded files {filesname}...")
+            zip_path = op.join(tempdir, filename)
+
+            def member_target(name: str) -> str:
+                # Mirror extractall's sanitization: drop absolute and
+                # parent-directory components so hostile member names
+                # cannot escape destination_dir
+                parts = [
+                    part
+                    for part in name.replace("\\", "/").split("/")
+                    if part not in ("", ".", "..")
+                ]
+                return op.join(destination_dir, *parts)
+
+            # Read the archive through a 1 MiB buffer instead of
+            # ZipFile's default 8 KiB reads
+            with open(zip_path, "rb", buffering=1 << 20) as fh:
+                with zipfile.ZipFile(fh) as zip_ref:
+                    members = []
+                    for info in zip_ref.infolist():
+                        target = member_target(info.filename)
+                        if info.is_dir():
+                            os.makedirs(target, exist_ok=True)
+                            continue
+                        # Skip members a previous or resumed run
+                        # already extracted
+                        if op.exists(target) and op.getsize(target) == info.file_size:
+                            continue
+                        os.makedirs(op.dirname(target) or ".", exist_ok=True)
+                        members.append(info.filename)
+                    filesname = zip_ref.namelist()[:2]
+
+            def extract_batch(names: List[str]) -> None:
+                # One handle per worker: ZipFile does not support
+                # concurrent reads on a shared handle
+                with open(zip_path, "rb", buffering=1 << 20) as worker_fh:
+                    with zipfile.ZipFile(worker_fh) as zf:
+                        for name in names:
+                            target = member_target(name)
+                            with zf.open(name) as src, open(target, "wb") as dst:
+                                shutil.copyfileobj(src, dst, length=1 << 20)
+
+            # Decompression releases the GIL, so imaging archives with
+            # many members extract in parallel
+            workers = min(len(members), os.cpu_count() or 1)
+            if workers > 1:
+                batches = [members[i::workers] for i in range(workers)]
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(extract_batch, batch) for batch in batches
+                    ]
+                    for future in futures:
+                        future.result()
+            elif members:
+                extract_batch(members)
+            logger.info(f"Successfully downloaded files {filesname}...")
         else:
             source = op.join(tempdir, filename)
             target = op.join(destination_dir, filename)
@@ -683,11 +772,17 @@ class PPMINavigator(HTMLHelper):
         """
 
         def postcondition() -> bool:
-            time.sleep(1)
-            return self.check_url_query(
-                self.driver.current_url,
-                {"page": "DOWNLOADS", "subPage": "IMAGE_COLLECTIONS"},
-            )
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.25).until(
+                    lambda driver: self.check_url_query(
+                        driver.current_url,
+                        {"page": "DOWNLOADS", "subPage": "IMAGE_COLLECTIONS"},
+                    )
+                )
+            except TimeoutException:
+                return False
+            else:
+                return True
 
         while not postcondition():
             self.click_button_by_text(
@@ -702,11 +797,17 @@ class PPMINavigator(HTMLHelper):
         """
 
         def postcondition() -> bool:
-            time.sleep(1)
-            return self.check_url_query(
-                self.driver.current_url,
-                {"page": "DOWNLOADS", "subPage": "GENETIC_DATA"},
-            )
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.25).until(
+                    lambda driver: self.check_url_query(
+                        driver.current_url,
+                        {"page": "DOWNLOADS", "subPage": "GENETIC_DATA"},
+                    )
+                )
+            except TimeoutException:
+                return False
+            else:
+                return True
 
         while not postcondition():
             self.click_button_by_text("Genetic Data", debug_name="Generic Data")
@@ -743,10 +844,17 @@ class PPMINavigator(HTMLHelper):
         """
 
         def postcondition() -> bool:
-            time.sleep(1)
-            return self.check_url_query(
-                self.driver.current_url, {"page": "SEARCH", "subPage": "SIMPLE_QUERY"}
-            )
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.25).until(
+                    lambda driver: self.check_url_query(
+                        driver.current_url,
+                        {"page": "SEARCH", "subPage": "SIMPLE_QUERY"},
+                    )
+                )
+            except TimeoutException:
+                return False
+            else:
+                return True
 
         while not postcondition():
             self.click_button_by_text(
@@ -761,10 +869,17 @@ class PPMINavigator(HTMLHelper):
         """
 
         def postcondition() -> bool:
-            time.sleep(1)
-            return self.check_url_query(
-                self.driver.current_url, {"page": "SEARCH", "subPage": "ADV_QUERY"}
-            )
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.25).until(
+                    lambda driver: self.check_url_query(
+                        driver.current_url,
+                        {"page": "SEARCH", "subPage": "ADV_QUERY"},
+                    )
+                )
+            except TimeoutException:
+                return False
+            else:
+                return True
 
         while not postcondition():
             self.click_button_by_text(
@@ -779,16 +894,18 @@ class PPMINavigator(HTMLHelper):
         """
 
         def postcondition() -> bool:
-            time.sleep(1)
-            try:
+            def tab_is_active(driver) -> bool:
                 return (
-                    self.driver.find_element(By.ID, "advSearchTabId").get_attribute(
-                        "title"
-                    )
+                    driver.find_element(By.ID, "advSearchTabId").get_attribute("title")
                     == "active"
                 )
-            except NoSuchElementException:
+
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.25).until(tab_is_active)
+            except (NoSuchElementException, TimeoutException):
                 return False
+            else:
+                return True
 
         while not postcondition():
             try:
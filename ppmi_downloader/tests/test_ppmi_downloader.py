@@ -92,6 +92,17 @@ def test_download_metadata(remote, no_headless):
     ppmi.quit()
 
 
+def test_download_metadata_parallel(remote, no_headless):
+    """Download 4 random files from PPMI with two workers."""
+    headless = not no_headless
+    with PPMIDownloader(remote=remote, tempdir=".", headless=headless) as ppmi:
+        with open(ppmi.file_ids_path, "r", encoding="utf-8") as fin:
+            file_id = json.load(fin)
+        filenames = file_id.keys()
+        random_names = random.sample(list(filenames), min(4, len(filenames)))
+        ppmi.download_metadata_parallel(random_names, max_workers=2)
+
+
 def test_download_3D_T1_info(remote, no_headless):
     headless = not no_headless
     ppmi = PPMIDownloader(remote=remote, tempdir=".", headless=headless)